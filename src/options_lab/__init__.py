@@ -1 +1,9 @@
-from .black_scholes import bs_price, bs_greeks
+__all__ = ["bs_price", "bs_greeks"]
+
+def __getattr__(name):
+    # Resolved lazily so `python -m options_lab.cli --help` does not pay for
+    # importing numpy/scipy/numba through black_scholes.
+    if name in __all__:
+        from . import black_scholes
+        return getattr(black_scholes, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
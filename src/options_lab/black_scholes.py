@@ -2,21 +2,246 @@
 
 All rates are annualized and continuously compounded.
 """
-from math import log, sqrt, exp, erf, pi, isfinite
+import ctypes
+import os
+import struct
+from math import log, sqrt, exp, erf, pi
 
+try:
+    import numpy as np
+except ImportError:  # vectorized pricing is optional
+    np = None
+
+try:
+    from scipy.special import ndtr
+    _HAS_SCIPY = True
+except ImportError:  # a ufunc fallback for ndtr is built below
+    _HAS_SCIPY = False
+
+try:
+    import numba
+    from numba import njit, prange
+except ImportError:  # numba is optional; the kernels then run as plain Python
+    numba = None
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda f: f
+    prange = range
+
+_INV_SQRT_2 = 0.7071067811865476    # 1/sqrt(2)
+_INV_SQRT_2PI = 0.3989422804014327  # 1/sqrt(2*pi)
+
+@njit(cache=True, fastmath=True)
 def _phi(x: float) -> float:
-    """Standard normal CDF using math.erf."""
-    return 0.5 * (1.0 + erf(x / sqrt(2.0)))
+    """Standard normal CDF using math.erf.
+
+    Kept on math.erf (not scipy.special.ndtr) so the Numba kernels can inline it;
+    the array path in `bs_price_vec` uses ndtr directly.
+    """
+    return 0.5 * (1.0 + erf(x * _INV_SQRT_2))
 
+if np is not None and not _HAS_SCIPY:
+    # Prefer a compiled ufunc so the array paths avoid per-element Python calls.
+    if numba is not None:
+        # not cached: the cache entry would be keyed to the importing module name,
+        # and compiling one ufunc at import is cheap
+        @numba.vectorize(["float64(float64)"])
+        def ndtr(x):
+            return 0.5 * (1.0 + erf(x * _INV_SQRT_2))
+    else:
+        # Last resort without scipy or numba: correct, but loops over elements in Python.
+        _erf_ufunc = np.frompyfunc(erf, 1, 1)
+
+        def ndtr(x):
+            return np.asarray(0.5 * (1.0 + _erf_ufunc(np.asarray(x, dtype=float) * _INV_SQRT_2)), dtype=float)
+
+@njit(cache=True, fastmath=True)
 def _pdf(x: float) -> float:
     """Standard normal PDF."""
-    return (1.0 / sqrt(2.0 * pi)) * exp(-0.5 * x * x)
+    return _INV_SQRT_2PI * exp(-0.5 * x * x)
+
+if numba is not None:
+    from numpy import float64 as _f64, uint64 as _u64
+
+    @njit(cache=True)
+    def _float_midpoint(a, b):
+        """Midpoint of two non-negative floats taken on their IEEE-754 bit patterns."""
+        ua = _f64(a).view(_u64)
+        ub = _f64(b).view(_u64)
+        return _u64((ua + ub) >> _u64(1)).view(_f64)
+else:
+    def _float_midpoint(a, b):
+        """Midpoint of two non-negative floats taken on their IEEE-754 bit patterns."""
+        ua, = struct.unpack("<Q", struct.pack("<d", a))
+        ub, = struct.unpack("<Q", struct.pack("<d", b))
+        return struct.unpack("<d", struct.pack("<Q", (ua + ub) // 2))[0]
+
+@njit(cache=True, fastmath=True)
+def _phi_fast(x: float) -> float:
+    """Standard normal CDF via Abramowitz–Stegun 26.2.17 (abs. error < 7.5e-8).
+
+    A short polynomial in t = 1/(1 + 0.2316419|x|) that LLVM inlines and vectorizes
+    more readily than math.erf.
+    """
+    t = 1.0 / (1.0 + 0.2316419 * abs(x))
+    y = t * (0.319381530 + t * (-0.356563782 + t * (1.781477937 + t * (-1.821255978 + t * 1.330274429))))
+    w = _INV_SQRT_2PI * exp(-0.5 * x * x) * y  # = 1 - Phi(|x|)
+    return 1.0 - w if x >= 0 else w
+
+_OPT_FLAGS = {"call": 1, "put": 0}
+
+def _is_call(opt_type: str) -> int:
+    """Parse opt_type once into the integer flag taken by the kernels (1 call, 0 put)."""
+    flag = _OPT_FLAGS.get(opt_type)
+    if flag is None:
+        # only pay for lower() on non-canonical spellings like 'Call'
+        flag = _OPT_FLAGS.get(opt_type.lower())
+        if flag is None:
+            raise ValueError("opt_type must be 'call' or 'put'")
+    return flag
+
+@njit(cache=True, fastmath=True)
+def _bs_price_df(S, K, sigma, T, is_call, df_r, df_q):
+    """Price kernel taking precomputed discount factors df_r = exp(-rT), df_q = exp(-qT)."""
+    sig_sqrtT = sigma * sqrt(T)
+    # log(S/K) + (r - q)T == log(S*df_q / (K*df_r)): the drift comes from the discount factors
+    d1 = log(S * df_q / (K * df_r)) / sig_sqrtT + 0.5 * sig_sqrtT
+    d2 = d1 - sig_sqrtT
+    Phi_d1 = _phi(d1)
+    Phi_d2 = _phi(d2)
+
+    # puts use Phi(-x) = 1 - Phi(x) rather than a second pair of erf calls
+    if is_call:
+        return S * df_q * Phi_d1 - K * df_r * Phi_d2
+    return K * df_r * (1.0 - Phi_d2) - S * df_q * (1.0 - Phi_d1)
+
+@njit(cache=True, fastmath=True)
+def _bs_price_nb(S, K, r, sigma, T, is_call, q):
+    """Scalar Black–Scholes price kernel; `is_call` is 1 for a call, 0 for a put."""
+    return _bs_price_df(S, K, sigma, T, is_call, exp(-r * T), exp(-q * T))
+
+@njit(cache=True, fastmath=True)
+def _bs_price_fast_nb(S, K, r, sigma, T, is_call, q):
+    """`_bs_price_nb` using the `_phi_fast` polynomial CDF (price error < ~1e-7 * max(S, K))."""
+    df_r = exp(-r * T)
+    df_q = exp(-q * T)
+    sig_sqrtT = sigma * sqrt(T)
+    d1 = (log(S / K) + (r - q) * T) / sig_sqrtT + 0.5 * sig_sqrtT
+    Phi_d1 = _phi_fast(d1)
+    Phi_d2 = _phi_fast(d1 - sig_sqrtT)
+
+    if is_call:
+        return S * df_q * Phi_d1 - K * df_r * Phi_d2
+    return K * df_r * (1.0 - Phi_d2) - S * df_q * (1.0 - Phi_d1)
+
+@njit(cache=True, fastmath=True)
+def _bs_greeks_nb(S, K, r, sigma, T, is_call, q):
+    """Scalar Greeks kernel returning (delta, gamma, vega, theta, rho)."""
+    sqrtT = sqrt(T)
+    sig_sqrtT = sigma * sqrtT
+    d1 = (log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / sig_sqrtT
+    d2 = d1 - sig_sqrtT
+    df_r = exp(-r * T)
+    df_q = exp(-q * T)
+    Phi_d1 = _phi(d1)
+    Phi_d2 = _phi(d2)
+    S_df_q_pdf = S * df_q * _pdf(d1)
 
-def _d1(S, K, r, sigma, T, q):
-    return (log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrt(T))
+    if is_call:
+        delta = df_q * Phi_d1
+        theta = -S_df_q_pdf * sigma / (2 * sqrtT) - r * K * df_r * Phi_d2 + q * S * df_q * Phi_d1
+        rho   =  K * T * df_r * Phi_d2
+    else:
+        delta = df_q * (Phi_d1 - 1)
+        theta = -S_df_q_pdf * sigma / (2 * sqrtT) + r * K * df_r * (1.0 - Phi_d2) - q * S * df_q * (1.0 - Phi_d1)
+        rho   = -K * T * df_r * (1.0 - Phi_d2)
+
+    gamma = S_df_q_pdf / (S * S * sig_sqrtT)
+    vega  = S_df_q_pdf * sqrtT
+
+    return delta, gamma, vega, theta, rho
+
+@njit(cache=True, fastmath=True)
+def _bs_price_vega_df(S, K, sigma, T, is_call, df_r, df_q):
+    """Price and vega in one pass (shared d1 and pdf(d1)), given discount factors."""
+    sqrtT = sqrt(T)
+    sig_sqrtT = sigma * sqrtT
+    d1 = log(S * df_q / (K * df_r)) / sig_sqrtT + 0.5 * sig_sqrtT
+    d2 = d1 - sig_sqrtT
+    Phi_d1 = _phi(d1)
+    Phi_d2 = _phi(d2)
+
+    if is_call:
+        price = S * df_q * Phi_d1 - K * df_r * Phi_d2
+    else:
+        price = K * df_r * (1.0 - Phi_d2) - S * df_q * (1.0 - Phi_d1)
+    return price, S * df_q * _pdf(d1) * sqrtT
+
+@njit(cache=True, fastmath=True)
+def _implied_vol_nb(target_price, S, K, r, T, is_call, q, tol, max_iter, lo, hi):
+    """Safeguarded Newton–Raphson kernel behind `implied_vol`."""
+    # r, q and T are fixed for the whole solve: discount once
+    df_r = exp(-r * T)
+    df_q = exp(-q * T)
 
-def _d2(d1, sigma, T):
-    return d1 - sigma * sqrt(T)
+    # No-arbitrage bounds: the price tends to the discounted intrinsic value as
+    # sigma -> 0 and to the discounted forward (call) / strike (put) as sigma -> inf.
+    # Targets at either bound need no solve at all.
+    S_df_q = S * df_q
+    K_df_r = K * df_r
+    if is_call:
+        intrinsic, upper = max(S_df_q - K_df_r, 0.0), S_df_q
+    else:
+        intrinsic, upper = max(K_df_r - S_df_q, 0.0), K_df_r
+    if target_price <= intrinsic + tol:
+        return lo
+    if target_price >= upper - tol:
+        return max(hi, 10.0)  # same cap as the expanded bracket below
+
+    # Bisection bracket: ensure monotonicity by checking prices at bounds
+    lo_p = _bs_price_df(S, K, lo, T, is_call, df_r, df_q)
+    hi_p = _bs_price_df(S, K, hi, T, is_call, df_r, df_q)
+    # If the target is outside bounds, expand once
+    if target_price <= lo_p:
+        return lo  # close to zero vol; better than failing (also keeps fa < 0 below)
+    if target_price > hi_p:
+        # try expanding hi to 10.0
+        hi2 = 10.0
+        hi2_p = _bs_price_df(S, K, hi2, T, is_call, df_r, df_q)
+        if hi2_p < target_price:
+            return hi2  # extremely high vol scenario
+        hi, hi_p = hi2, hi2_p
+
+    # the bracket prices are already known; only the lower residual is tracked
+    a, b = lo, hi
+    fa = lo_p - target_price
+
+    # Brenner–Subrahmanyam initial guess (exact for ATM-forward), kept inside the bracket
+    m = sqrt(2.0 * pi / T) * target_price / S
+    if not a < m < b:
+        m = _float_midpoint(a, b)
+    fm_prev = hi_p - lo_p  # bounds |f| anywhere inside the bracket
+
+    for _ in range(max_iter):
+        p, vega = _bs_price_vega_df(S, K, m, T, is_call, df_r, df_q)
+        fm = p - target_price
+        if abs(fm) < tol:
+            return m
+        # choose the side that brackets the root: m replaces the end whose residual
+        # has the same sign; a select rather than a hard-to-predict branch
+        sign_match = (fa >= 0) == (fm >= 0)
+        a, fa, b = (m, fm, b) if sign_match else (a, fa, m)
+        # Newton step on price with vega as derivative; bisect if it leaves
+        # the bracket or the residual is not shrinking
+        m_new = m - fm / vega if vega > 0 else b
+        if not (a < m_new < b and abs(fm) < fm_prev):
+            # bisect the bit pattern: ~log-space steps across a bracket spanning many binades
+            m_new = _float_midpoint(a, b)
+        m, fm_prev = m_new, abs(fm)
+
+    return m  # best effort
 
 def bs_price(S: float, K: float, r: float, sigma: float, T: float, opt_type: str = "call", q: float = 0.0) -> float:
     """Black–Scholes price for a European call/put with dividend yield q.
@@ -28,84 +253,307 @@ def bs_price(S: float, K: float, r: float, sigma: float, T: float, opt_type: str
     T: time to maturity in years
     opt_type: 'call' or 'put'
     q: continuous dividend yield (annual, cont. comp). For non-dividend underlyings use 0.
+
+    If any of S, K, sigma, T is a NumPy array the call is forwarded to `bs_price_vec`.
     """
+    if np is not None and any(isinstance(x, np.ndarray) for x in (S, K, sigma, T)):
+        return bs_price_vec(S, K, r, sigma, T, opt_type, q)
     if sigma <= 0 or T <= 0 or S <= 0 or K <= 0:
         raise ValueError("Inputs must be positive and sigma,T>0")
-    d1 = _d1(S, K, r, sigma, T, q)
-    d2 = _d2(d1, sigma, T)
-    df_r = exp(-r * T)
-    df_q = exp(-q * T)
+    return _bs_price_nb(float(S), float(K), float(r), float(sigma), float(T), _is_call(opt_type), float(q))
+
+def bs_price_vec(S, K, r, sigma, T, opt_type: str = "call", q: float = 0.0):
+    """Vectorized `bs_price`: S, K, sigma, T may be arrays or scalars (broadcast together).
+
+    Returns a NumPy array of prices. Requires numpy (scipy optional).
+    """
+    if np is None:
+        raise ImportError("bs_price_vec requires numpy")
+    S, K, sigma, T = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (S, K, sigma, T)))
+    if np.any(sigma <= 0) or np.any(T <= 0) or np.any(S <= 0) or np.any(K <= 0):
+        raise ValueError("Inputs must be positive and sigma,T>0")
+    sig_sqrt_T = sigma * np.sqrt(T)
+    d1 = (np.log(S / K) + (r - q) * T) / sig_sqrt_T + 0.5 * sig_sqrt_T
+    d2 = d1 - sig_sqrt_T
+    df_r = np.exp(-r * T)
+    df_q = np.exp(-q * T)
+
+    if _is_call(opt_type):
+        return S * df_q * ndtr(d1) - K * df_r * ndtr(d2)
+    return K * df_r * ndtr(-d2) - S * df_q * ndtr(-d1)
+
+def _call_flags(is_call):
+    """Validate array-path `is_call` flags (0/1 or bool; strings are not accepted) as floats."""
+    flags = np.asarray(is_call)
+    if flags.dtype.kind not in "biuf" or not np.all((flags == 0) | (flags == 1)):
+        raise ValueError("is_call must hold 0/1 (or bool) flags, not 'call'/'put' strings")
+    return flags.astype(float)
+
+def bs_greeks_batch(S, K, r, sigma, T, is_call, q: float = 0.0):
+    """Vectorized `bs_greeks` returning (delta, gamma, vega, theta, rho) as five arrays.
+
+    S, K, sigma, T and is_call (1/True for a call, 0/False for a put) broadcast together.
+    Same units as `bs_greeks`. Requires numpy (scipy optional).
+    """
+    if np is None:
+        raise ImportError("bs_greeks_batch requires numpy")
+    S, K, sigma, T, is_call = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (S, K, sigma, T)),
+                                                  _call_flags(is_call))
+    if np.any(sigma <= 0) or np.any(T <= 0) or np.any(S <= 0) or np.any(K <= 0):
+        raise ValueError("Inputs must be positive and sigma,T>0")
+    sqrt_T = np.sqrt(T)
+    sig_sqrt_T = sigma * sqrt_T
+    d1 = (np.log(S / K) + (r - q) * T) / sig_sqrt_T + 0.5 * sig_sqrt_T
+    d2 = d1 - sig_sqrt_T
+    df_r = np.exp(-r * T)
+    df_q = np.exp(-q * T)
+    S_df_q_pdf = S * df_q * _INV_SQRT_2PI * np.exp(-0.5 * d1 * d1)
+
+    # Signed N(d1), N(d2): Phi(x) for calls, -Phi(-x) = Phi(x) - 1 for puts,
+    # so one expression per Greek covers both option types
+    put = 1.0 - is_call
+    N1 = ndtr(d1) - put
+    N2 = ndtr(d2) - put
+
+    delta = df_q * N1
+    gamma = S_df_q_pdf / (S * S * sig_sqrt_T)
+    vega  = S_df_q_pdf * sqrt_T
+    theta = -S_df_q_pdf * sigma / (2 * sqrt_T) - r * K * df_r * N2 + q * S * df_q * N1
+    rho   = K * T * df_r * N2
+    return delta, gamma, vega, theta, rho
+
+@njit(parallel=True, fastmath=True, cache=True)
+def bs_price_batch(S, K, r, sigma, T, is_call, q, out, fast=False):
+    """Price a batch of options into `out` with a (thread-parallel, when JIT'd) scalar loop.
 
-    if opt_type.lower() == "call":
-        return S * df_q * _phi(d1) - K * df_r * _phi(d2)
-    elif opt_type.lower() == "put":
-        return K * df_r * _phi(-d2) - S * df_q * _phi(-d1)
+    S, K, sigma, T, out: float64 arrays of equal length
+    is_call: int8 array, 1 for a call and 0 for a put
+    r, q: scalars shared by the whole batch
+    fast: use the polynomial normal CDF instead of erf (accurate to ~1e-7 relative to S, K)
+    No input validation is done here; returns `out`.
+    """
+    if fast:
+        for i in prange(out.shape[0]):
+            out[i] = _bs_price_fast_nb(S[i], K[i], r, sigma[i], T[i], is_call[i], q)
     else:
-        raise ValueError("opt_type must be 'call' or 'put'")
+        for i in prange(out.shape[0]):
+            out[i] = _bs_price_nb(S[i], K[i], r, sigma[i], T[i], is_call[i], q)
+    return out
 
-def bs_greeks(S: float, K: float, r: float, sigma: float, T: float, opt_type: str = "call", q: float = 0.0) -> dict:
-    """Returns Delta, Gamma, Vega, Theta, Rho for a European option with dividend yield q.
-    Theta is per-year; Vega and Rho are per 1.00 change in sigma/r (per vol-point ~ vega*0.01).
+def _load_c_kernel(here=None):
+    """Load `bs_price_array` from the optional compiled `_bs_c` library (see _bs_c.c).
+
+    Looks next to this file unless `here` is given. Returns None when the library is
+    missing or cannot be loaded (stale, corrupt, wrong architecture).
     """
-    d1 = _d1(S, K, r, sigma, T, q)
-    d2 = _d2(d1, sigma, T)
-    pdf = _pdf(d1)
+    if np is None:
+        return None
+    if here is None:
+        here = os.path.dirname(os.path.abspath(__file__))
+    for name in ("_bs_c.so", "_bs_c.dylib", "_bs_c.dll"):
+        path = os.path.join(here, name)
+        if os.path.exists(path):
+            try:
+                fn = ctypes.CDLL(path).bs_price_array
+            except (OSError, AttributeError):
+                return None
+            f64 = np.ctypeslib.ndpointer(np.float64, flags="C_CONTIGUOUS")
+            i8 = np.ctypeslib.ndpointer(np.int8, flags="C_CONTIGUOUS")
+            fn.argtypes = [f64, f64, ctypes.c_double, f64, f64, i8, ctypes.c_double, f64, ctypes.c_size_t]
+            fn.restype = None
+            return fn
+    return None
+
+_bs_price_array_c = _load_c_kernel()
+
+def bs_price_batch_c(S, K, r, sigma, T, is_call, q, out):
+    """`bs_price_batch` through the compiled C kernel in `_bs_c.c` when it has been built.
+
+    Same arguments as `bs_price_batch`; `out` must be a C-contiguous float64 array and
+    every input must have out.shape[0] elements.
+    Falls back to `bs_price_batch` when the library is not available. Returns `out`.
+    """
+    if np is None:
+        raise ImportError("bs_price_batch_c requires numpy")
+    if out.dtype != np.float64 or not out.flags.c_contiguous:
+        raise ValueError("out must be a C-contiguous float64 array")
+    S, K, sigma, T = (np.ascontiguousarray(x, dtype=np.float64) for x in (S, K, sigma, T))
+    is_call = np.ascontiguousarray(is_call, dtype=np.int8)
+    n = out.shape[0]
+    # the kernels index every input up to n without bounds checks
+    if any(x.size != n for x in (S, K, sigma, T, is_call)):
+        raise ValueError("S, K, sigma, T and is_call must all have out.shape[0] elements")
+    if _bs_price_array_c is None:
+        return bs_price_batch(S, K, r, sigma, T, is_call, q, out)
+    _bs_price_array_c(S, K, float(r), sigma, T, is_call, float(q), out, n)
+    return out
+
+def make_bs_price(r: float, T: float, q: float = 0.0, opt_type: str = "call"):
+    """Return f(S, K, sigma) pricing options that share (r, T, q, opt_type), e.g. one expiry of a surface.
+
+    Discount factors, sqrt(T), the (r - q)T drift and the option flag are computed once here.
+    The returned function skips input validation.
+    """
+    if T <= 0:
+        raise ValueError("T must be positive")
+    is_call = _is_call(opt_type)
     df_r = exp(-r * T)
     df_q = exp(-q * T)
+    sqrtT = sqrt(T)
+    drift = (r - q) * T
 
-    if opt_type.lower() == "call":
-        delta = df_q * _phi(d1)
-        theta = -(S * df_q * pdf * sigma) / (2 * sqrt(T)) - r * K * df_r * _phi(d2) + q * S * df_q * _phi(d1)
-        rho   =  K * T * df_r * _phi(d2)
-    else:
-        delta = df_q * (_phi(d1) - 1)
-        theta = -(S * df_q * pdf * sigma) / (2 * sqrt(T)) + r * K * df_r * _phi(-d2) - q * S * df_q * _phi(-d1)
-        rho   = -K * T * df_r * _phi(-d2)
+    def f(S, K, sigma):
+        sig_sqrtT = sigma * sqrtT
+        d1 = (log(S / K) + drift) / sig_sqrtT + 0.5 * sig_sqrtT
+        Phi_d1 = 0.5 * (1.0 + erf(d1 * _INV_SQRT_2))
+        Phi_d2 = 0.5 * (1.0 + erf((d1 - sig_sqrtT) * _INV_SQRT_2))
+        if is_call:
+            return S * df_q * Phi_d1 - K * df_r * Phi_d2
+        return K * df_r * (1.0 - Phi_d2) - S * df_q * (1.0 - Phi_d1)
 
-    gamma = df_q * pdf / (S * sigma * sqrt(T))
-    vega  = S * df_q * pdf * sqrt(T)
+    return f
 
+def make_bs_price_fixed_sigma(r: float, T: float, sigma: float, q: float = 0.0, opt_type: str = "call"):
+    """Like `make_bs_price` but with sigma fixed too: returns f(S, K), e.g. for spot/strike sweeps."""
+    if T <= 0 or sigma <= 0:
+        raise ValueError("sigma,T must be positive")
+    is_call = _is_call(opt_type)
+    df_r = exp(-r * T)
+    df_q = exp(-q * T)
+    sig_sqrtT = sigma * sqrt(T)
+    inv_sig_sqrtT = 1.0 / sig_sqrtT
+    d1_shift = (r - q) * T * inv_sig_sqrtT + 0.5 * sig_sqrtT
+
+    def f(S, K):
+        d1 = log(S / K) * inv_sig_sqrtT + d1_shift
+        Phi_d1 = 0.5 * (1.0 + erf(d1 * _INV_SQRT_2))
+        Phi_d2 = 0.5 * (1.0 + erf((d1 - sig_sqrtT) * _INV_SQRT_2))
+        if is_call:
+            return S * df_q * Phi_d1 - K * df_r * Phi_d2
+        return K * df_r * (1.0 - Phi_d2) - S * df_q * (1.0 - Phi_d1)
+
+    return f
+
+def bs_greeks(S: float, K: float, r: float, sigma: float, T: float, opt_type: str = "call", q: float = 0.0) -> dict:
+    """Returns Delta, Gamma, Vega, Theta, Rho for a European option with dividend yield q.
+    Theta is per-year; Vega and Rho are per 1.00 change in sigma/r (per vol-point ~ vega*0.01).
+    """
+    is_call = _is_call(opt_type)
+    delta, gamma, vega, theta, rho = _bs_greeks_nb(float(S), float(K), float(r), float(sigma), float(T),
+                                                   is_call, float(q))
     return {"delta": delta, "gamma": gamma, "vega": vega, "theta": theta, "rho": rho}
 
 def implied_vol(target_price: float, S: float, K: float, r: float, T: float, opt_type: str = "call", q: float = 0.0,
                 tol: float = 1e-8, max_iter: int = 100, lo: float = 1e-6, hi: float = 5.0) -> float:
-    """Solve for Black–Scholes implied volatility using a robust bisection method.
+    """Solve for Black–Scholes implied volatility using Newton–Raphson safeguarded by bisection.
 
     target_price: market price of the option
     returns: sigma (vol) such that bs_price(..., sigma, ...) ~= target_price
     """
     if target_price <= 0:
         raise ValueError("target_price must be positive")
+    if S <= 0 or K <= 0 or T <= 0:
+        raise ValueError("Inputs must be positive and T>0")
+    return _implied_vol_nb(float(target_price), float(S), float(K), float(r), float(T), _is_call(opt_type),
+                           float(q), float(tol), int(max_iter), float(lo), float(hi))
 
-    # Bisection bracket: ensure monotonicity by checking prices at bounds
-    def price(sig):
-        return bs_price(S, K, r, sig, T, opt_type, q)
+def implied_vol_vec(target_price, S, K, r: float, T, is_call, q: float = 0.0,
+                    tol: float = 1e-8, max_iter: int = 100, lo: float = 1e-6, hi: float = 5.0):
+    """Vectorized `implied_vol`: solves every lane at once with masked, safeguarded Newton steps.
 
-    lo_p = price(lo)
-    hi_p = price(hi)
-    # If the target is outside bounds, expand once
-    if target_price < lo_p:
-        return lo  # close to zero vol; better than failing
-    if target_price > hi_p:
-        # try expanding hi to 10.0
-        hi2 = 10.0
-        if price(hi2) < target_price:
-            return hi2  # extremely high vol scenario
-        hi, hi_p = hi2, price(hi2)
+    target_price, S, K, T and is_call (1/True for a call, 0/False for a put) broadcast together.
+    Each iteration prices only the lanes that have not converged; lanes whose Newton step
+    leaves their bracket (or stalls) take a bisection step instead, as in `implied_vol`.
+    Returns an array of vols. Requires numpy (scipy optional).
+    """
+    if np is None:
+        raise ImportError("implied_vol_vec requires numpy")
+    target, S, K, T, is_call = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (target_price, S, K, T)), _call_flags(is_call))
+    shape = target.shape
+    target, S, K, T, is_call = (x.ravel() for x in (target, S, K, T, is_call))
+    if np.any(target <= 0):
+        raise ValueError("target_price must be positive")
+    if np.any(S <= 0) or np.any(K <= 0) or np.any(T <= 0):
+        raise ValueError("Inputs must be positive and T>0")
+    n = target.size
 
-    a, b = lo, hi
-    fa = price(a) - target_price
-    fb = price(b) - target_price
+    df_r = np.exp(-r * T)
+    df_q = np.exp(-q * T)
+    S_df_q = S * df_q
+    K_df_r = K * df_r
+    log_fwd = np.log(S_df_q / K_df_r)
+    sqrt_T = np.sqrt(T)
+    put = 1.0 - is_call
+
+    def price_vega(i, sig):
+        sig_sqrt_T = sig * sqrt_T[i]
+        d1 = log_fwd[i] / sig_sqrt_T + 0.5 * sig_sqrt_T
+        # signed N(d): Phi(d) - 1 = -Phi(-d) for puts
+        price = S_df_q[i] * (ndtr(d1) - put[i]) - K_df_r[i] * (ndtr(d1 - sig_sqrt_T) - put[i])
+        return price, S_df_q[i] * _INV_SQRT_2PI * np.exp(-0.5 * d1 * d1) * sqrt_T[i]
+
+    def float_midpoint(a, b):
+        # vectorized `_float_midpoint`: bisect the IEEE-754 bit patterns
+        return ((a.view(np.uint64) + b.view(np.uint64)) >> np.uint64(1)).view(np.float64)
 
+    lanes = np.arange(n)
+    out = np.empty(n)
+    # No-arbitrage bounds short-circuit, as in `implied_vol`
+    intrinsic = np.maximum((S_df_q - K_df_r) * (1.0 - 2.0 * put), 0.0)
+    upper = np.where(put == 1.0, K_df_r, S_df_q)
+    at_lower = target <= intrinsic + tol
+    at_upper = ~at_lower & (target >= upper - tol)
+    out[at_lower] = lo
+    out[at_upper] = max(hi, 10.0)
+    settled = at_lower | at_upper
+
+    a = np.full(n, lo)
+    b = np.full(n, hi)
+    lo_p = price_vega(lanes, a)[0]
+    hi_p = price_vega(lanes, b)[0]
+    # Same bracket handling as `implied_vol`: clamp to lo, expand hi once to 10.0
+    below = ~settled & (target <= lo_p)
+    out[below] = lo
+    settled |= below
+    above = ~settled & (target > hi_p)
+    if above.any():
+        hi2_p = price_vega(lanes[above], np.full(above.sum(), 10.0))[0]
+        b[above] = 10.0
+        hi_p[above] = hi2_p
+        too_high = np.zeros(n, dtype=bool)
+        too_high[above] = hi2_p < target[above]
+        out[too_high] = 10.0
+        settled |= too_high
+
+    # Brenner–Subrahmanyam initial guess, kept inside each lane's bracket
+    sig = np.sqrt(2.0 * np.pi / T) * target / S
+    outside = ~((a < sig) & (sig < b))
+    sig[outside] = float_midpoint(a[outside], b[outside])
+    f_prev = hi_p - lo_p  # bounds |f| anywhere inside the bracket
+
+    idx = np.flatnonzero(~settled)
     for _ in range(max_iter):
-        m = 0.5 * (a + b)
-        fm = price(m) - target_price
-        if abs(fm) < tol:
-            return m
-        # choose the side that brackets the root
-        if fa * fm <= 0:
-            b, fb = m, fm
-        else:
-            a, fa = m, fm
+        if idx.size == 0:
+            break
+        s_i = sig[idx]
+        p, vega = price_vega(idx, s_i)
+        f = p - target[idx]
+        done = np.abs(f) < tol
+        out[idx[done]] = s_i[done]
+        keep = ~done
+        idx, s_i, f, vega = idx[keep], s_i[keep], f[keep], vega[keep]
+
+        # price is increasing in sigma: the sign of f says which end to move
+        up = f >= 0
+        a_i = np.where(up, a[idx], s_i)
+        b_i = np.where(up, s_i, b[idx])
+        with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+            s_new = s_i - f / vega
+        abs_f = np.abs(f)
+        newton_ok = (a_i < s_new) & (s_new < b_i) & (abs_f < f_prev[idx])
+        s_new = np.where(newton_ok, s_new, float_midpoint(a_i, b_i))
+        a[idx], b[idx], sig[idx], f_prev[idx] = a_i, b_i, s_new, abs_f
 
-    return 0.5 * (a + b)  # best effort
+    out[idx] = sig[idx]  # best effort for lanes that ran out of iterations
+    return out.reshape(shape)
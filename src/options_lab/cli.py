@@ -1,8 +1,10 @@
 """CLI to price European options (with dividend yield) or compute implied vol."""
-import argparse
-from .black_scholes import bs_price, bs_greeks, implied_vol
 
 def main():
+    # Imports are deferred so --help and argument errors stay cheap, and each
+    # path only loads what it uses.
+    import argparse
+
     p = argparse.ArgumentParser(description="Black–Scholes option pricer (educational)")
     p.add_argument("--S", type=float, required=True, help="Spot price")
     p.add_argument("--K", type=float, required=True, help="Strike")
@@ -16,6 +18,7 @@ def main():
     args = p.parse_args()
 
     if args.iv is not None:
+        from .black_scholes import implied_vol
         sigma = implied_vol(args.iv, args.S, args.K, args.r, args.T, args.type, args.q)
         print(f"Implied vol (sigma): {sigma:.6f}")
         return
@@ -23,10 +26,12 @@ def main():
     if args.sigma is None:
         p.error("--sigma is required unless you pass --iv to solve for volatility from price.")
 
+    from .black_scholes import bs_price
     price = bs_price(args.S, args.K, args.r, args.sigma, args.T, args.type, args.q)
     print(f"{args.type.capitalize()} price: {price:.6f}")
 
     if args.greeks:
+        from .black_scholes import bs_greeks
         g = bs_greeks(args.S, args.K, args.r, args.sigma, args.T, args.type, args.q)
         for k, v in g.items():
             print(f"{k.capitalize():<6}: {v:.6f}")
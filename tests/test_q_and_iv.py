@@ -1,5 +1,6 @@
 import math
-from options_lab.black_scholes import bs_price, implied_vol
+import pytest
+from options_lab.black_scholes import bs_price, bs_greeks, implied_vol
 
 def approx(a, b, tol=1e-4):
     return abs(a - b) <= tol
@@ -23,3 +24,62 @@ def test_implied_vol_recovers_true_sigma():
     market = bs_price(S, K, r, sigma_true, T, 'call', q)
     est = implied_vol(market, S, K, r, T, 'call', q)
     assert approx(est, sigma_true, 5e-4)
+
+def test_greeks_call_put_delta_relation():
+    S, K, r, sigma, T, q = 100, 105, 0.03, 0.25, 0.5, 0.02
+    gc = bs_greeks(S, K, r, sigma, T, 'call', q)
+    gp = bs_greeks(S, K, r, sigma, T, 'put', q)
+    # Delta_call - Delta_put = exp(-qT); gamma and vega agree
+    assert approx(gc["delta"] - gp["delta"], math.exp(-q*T), 1e-10)
+    assert approx(gc["gamma"], gp["gamma"], 1e-12)
+    assert approx(gc["vega"], gp["vega"], 1e-10)
+
+def test_implied_vol_recovers_across_strikes_and_types():
+    S, r, T, q = 100, 0.03, 0.75, 0.01
+    for K in (70, 90, 100, 110, 140):
+        for opt in ('call', 'put'):
+            for sigma_true in (0.1, 0.4, 1.2):
+                market = bs_price(S, K, r, sigma_true, T, opt, q)
+                est = implied_vol(market, S, K, r, T, opt, q)
+                assert approx(est, sigma_true, 5e-4)
+
+def test_float_midpoint_bisects_bit_pattern():
+    from options_lab.black_scholes import _float_midpoint
+    assert _float_midpoint(1.0, 4.0) == 2.0  # exponent bits average: log-space midpoint
+    assert 1e-6 < _float_midpoint(1e-6, 5.0) < 5.0
+    x = 2.0
+    assert _float_midpoint(x, math.nextafter(x, 3.0)) == x
+
+def test_opt_type_parsing():
+    S, K, r, sigma, T = 100, 100, 0.05, 0.2, 1.0
+    assert bs_price(S, K, r, sigma, T, 'Call') == bs_price(S, K, r, sigma, T, 'call')
+    assert bs_price(S, K, r, sigma, T, 'PUT') == bs_price(S, K, r, sigma, T, 'put')
+    with pytest.raises(ValueError):
+        bs_price(S, K, r, sigma, T, 'straddle')
+
+def test_specialized_pricers_match_bs_price():
+    from options_lab.black_scholes import make_bs_price, make_bs_price_fixed_sigma
+    r, T, q = 0.04, 0.5, 0.015
+    for opt in ('call', 'put'):
+        f = make_bs_price(r, T, q, opt)
+        g = make_bs_price_fixed_sigma(r, T, 0.3, q, opt)
+        for K in (80, 100, 125):
+            assert approx(f(100, K, 0.3), bs_price(100, K, r, 0.3, T, opt, q), 1e-10)
+            assert approx(g(100, K), bs_price(100, K, r, 0.3, T, opt, q), 1e-10)
+
+def test_implied_vol_short_circuits_at_no_arbitrage_bounds():
+    S, K, r, T, q = 100, 60, 0.05, 1.0, 0.0
+    intrinsic = S - K * math.exp(-r * T)
+    assert implied_vol(intrinsic + 1e-10, S, K, r, T, 'call', q) == 1e-6
+    assert implied_vol(S - 1e-10, S, K, r, T, 'call', q) == 10.0
+    assert implied_vol(K * math.exp(-r * T) - 1e-10, S, K, r, T, 'put', q) == 10.0
+
+def test_bs_greeks_rejects_unknown_opt_type():
+    with pytest.raises(ValueError):
+        bs_greeks(100, 100, 0.05, 0.2, 1.0, 'straddle')
+    assert bs_greeks(100, 100, 0.05, 0.2, 1.0, 'Put') == bs_greeks(100, 100, 0.05, 0.2, 1.0, 'put')
+
+def test_implied_vol_rejects_non_positive_inputs():
+    for S, K, T in ((100, -100, 1.0), (-100, 100, 1.0), (100, 100, 0.0), (100, 100, -1.0)):
+        with pytest.raises(ValueError):
+            implied_vol(5.0, S, K, 0.05, T)
@@ -0,0 +1,164 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from options_lab.black_scholes import bs_price, bs_price_vec
+
+def check_batch_pricer(pricer):
+    # mixed calls/puts priced by a bs_price_batch-style function vs bs_price_vec
+    n = 9
+    S = np.full(n, 100.0)
+    K = np.linspace(70, 130, n)
+    sigma = np.linspace(0.1, 0.6, n)
+    T = np.linspace(0.2, 2.0, n)
+    is_call = (np.arange(n) % 2).astype(np.int8)
+    out = pricer(S, K, 0.04, sigma, T, is_call, 0.01, np.empty(n))
+    ref = np.where(is_call == 1,
+                   bs_price_vec(S, K, 0.04, sigma, T, 'call', 0.01),
+                   bs_price_vec(S, K, 0.04, sigma, T, 'put', 0.01))
+    assert np.allclose(out, ref, atol=1e-9)
+
+def test_bs_price_vec_matches_scalar():
+    S = np.array([80.0, 100.0, 120.0])
+    K = np.array([100.0, 100.0, 90.0])
+    sigma = np.array([0.15, 0.2, 0.35])
+    T = np.array([0.25, 1.0, 2.0])
+    for opt in ("call", "put"):
+        out = bs_price_vec(S, K, 0.05, sigma, T, opt, 0.02)
+        ref = [bs_price(s, k, 0.05, v, t, opt, 0.02) for s, k, v, t in zip(S, K, sigma, T)]
+        assert np.allclose(out, ref, atol=1e-10)
+
+def test_ndtr_matches_scalar_phi():
+    from options_lab.black_scholes import ndtr, _phi
+    xs = np.linspace(-8, 8, 401)
+    assert np.allclose(ndtr(xs), [_phi(float(x)) for x in xs], rtol=0, atol=1e-14)
+
+def test_bs_price_dispatches_on_arrays():
+    K = np.linspace(80, 120, 5)
+    out = bs_price(100.0, K, 0.05, 0.2, 1.0, 'call')
+    assert out.shape == (5,)
+    assert np.all(np.diff(out) < 0)  # call value falls with strike
+
+def test_bs_price_batch_matches_vec():
+    from options_lab.black_scholes import bs_price_batch
+    check_batch_pricer(bs_price_batch)
+
+def test_phi_fast_matches_norm_cdf():
+    norm = pytest.importorskip("scipy.stats").norm
+    from options_lab.black_scholes import _phi_fast
+    xs = np.linspace(-10, 10, 4001)
+    err = max(abs(_phi_fast(float(x)) - norm.cdf(x)) for x in xs)
+    assert err < 7.5e-8
+
+def test_bs_price_batch_fast_close_to_exact():
+    from options_lab.black_scholes import bs_price_batch
+    n = 50
+    S = np.full(n, 100.0)
+    K = np.linspace(60, 140, n)
+    sigma = np.full(n, 0.25)
+    T = np.full(n, 0.75)
+    is_call = np.ones(n, dtype=np.int8)
+    exact = bs_price_batch(S, K, 0.03, sigma, T, is_call, 0.0, np.empty(n))
+    fast = bs_price_batch(S, K, 0.03, sigma, T, is_call, 0.0, np.empty(n), True)
+    assert np.max(np.abs(fast - exact)) < 2e-5
+
+def test_bs_greeks_batch_matches_scalar():
+    from options_lab.black_scholes import bs_greeks, bs_greeks_batch
+    K = np.array([80.0, 95.0, 100.0, 110.0, 130.0])
+    is_call = np.array([1, 0, 1, 0, 1])
+    out = bs_greeks_batch(100.0, K, 0.04, 0.3, 0.8, is_call, 0.02)
+    names = ("delta", "gamma", "vega", "theta", "rho")
+    for i, (k, c) in enumerate(zip(K, is_call)):
+        ref = bs_greeks(100.0, k, 0.04, 0.3, 0.8, 'call' if c else 'put', 0.02)
+        for name, arr in zip(names, out):
+            assert abs(arr[i] - ref[name]) < 1e-9
+
+def test_implied_vol_vec_matches_scalar():
+    from options_lab.black_scholes import implied_vol, implied_vol_vec
+    K = np.repeat([70.0, 90.0, 100.0, 110.0, 140.0], 2)
+    is_call = np.tile([1, 0], 5)
+    sigma_true = np.linspace(0.1, 1.2, 10)
+    T = 0.75
+    market = np.array([bs_price(100.0, k, 0.03, s, T, 'call' if c else 'put', 0.01)
+                       for k, c, s in zip(K, is_call, sigma_true)])
+    est = implied_vol_vec(market, 100.0, K, 0.03, T, is_call, 0.01)
+    assert np.allclose(est, sigma_true, atol=5e-4)
+    ref = [implied_vol(m, 100.0, k, 0.03, T, 'call' if c else 'put', 0.01) for m, k, c in zip(market, K, is_call)]
+    assert np.allclose(est, ref, atol=1e-6)
+
+def test_implied_vol_vec_bracket_edges():
+    from options_lab.black_scholes import implied_vol_vec
+    # below the zero-vol price -> lo; above the sigma=10 price -> 10.0
+    est = implied_vol_vec(np.array([1e-3, 99.0]), 100.0, np.array([50.0, 100.0]), 0.05, 0.1, 1)
+    assert est[0] == 1e-6 and est[1] == 10.0
+
+def test_bs_price_batch_c_matches_vec():
+    # exercises the C kernel when _bs_c has been compiled, the bs_price_batch fallback otherwise
+    from options_lab.black_scholes import bs_price_batch_c
+    check_batch_pricer(bs_price_batch_c)
+
+def test_bs_price_batch_c_rejects_length_mismatch():
+    from options_lab.black_scholes import bs_price_batch_c
+    x = np.full(3, 100.0)
+    with pytest.raises(ValueError):
+        bs_price_batch_c(x, x, 0.05, np.full(3, 0.2), np.ones(3), np.ones(3, np.int8), 0.0, np.empty(5))
+
+def test_load_c_kernel_ignores_unloadable_library(tmp_path):
+    from options_lab.black_scholes import _load_c_kernel
+    (tmp_path / "_bs_c.so").write_bytes(b"not a shared library")
+    assert _load_c_kernel(str(tmp_path)) is None
+
+def test_bs_price_batch_c_compiled_kernel(tmp_path, monkeypatch):
+    import os
+    import shutil
+    import subprocess
+    import options_lab.black_scholes as bs
+    cc = shutil.which("gcc") or shutil.which("cc")
+    if cc is None:
+        pytest.skip("no C compiler available")
+    src = os.path.join(os.path.dirname(bs.__file__), "_bs_c.c")
+    built = subprocess.run([cc, "-O2", "-shared", "-fPIC", "-o", str(tmp_path / "_bs_c.so"), src, "-lm"],
+                           capture_output=True)
+    if built.returncode != 0:
+        pytest.skip("could not compile _bs_c.c")
+    kernel = bs._load_c_kernel(str(tmp_path))
+    assert kernel is not None
+    monkeypatch.setattr(bs, "_bs_price_array_c", kernel)
+    check_batch_pricer(bs.bs_price_batch_c)
+
+@pytest.mark.parametrize("hidden", [("scipy",), ("scipy", "numba")])
+def test_ndtr_fallbacks_without_scipy(hidden, monkeypatch):
+    import importlib.util
+    import sys
+    import options_lab.black_scholes as bs
+    for name in hidden:
+        monkeypatch.setitem(sys.modules, name, None)
+    monkeypatch.delitem(sys.modules, "scipy.special", raising=False)
+    # load a separate copy of the module so the shared one keeps scipy's ndtr
+    spec = importlib.util.spec_from_file_location("_bs_without_scipy", bs.__file__)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    assert not mod._HAS_SCIPY
+
+    xs = np.linspace(-8, 8, 401)
+    assert np.allclose(mod.ndtr(xs), [mod._phi(float(x)) for x in xs], rtol=0, atol=1e-14)
+    # all-scalar arguments go through ndtr on 0-d arrays
+    assert abs(float(mod.bs_price_vec(100, 100, 0.05, 0.2, 1.0)) - bs.bs_price(100, 100, 0.05, 0.2, 1.0)) < 1e-12
+    K = np.linspace(80, 120, 5)
+    assert np.allclose(mod.bs_price_vec(100.0, K, 0.05, 0.2, 1.0, 'put'),
+                       bs.bs_price_vec(100.0, K, 0.05, 0.2, 1.0, 'put'), atol=1e-12)
+
+def test_bs_greeks_batch_rejects_bad_inputs():
+    from options_lab.black_scholes import bs_greeks_batch
+    with pytest.raises(ValueError):
+        bs_greeks_batch(100.0, np.array([90.0, 110.0]), 0.05, 0.0, 1.0, 1)
+    with pytest.raises(ValueError):
+        bs_greeks_batch(100.0, 100.0, 0.05, 0.2, 1.0, 'call')
+    with pytest.raises(ValueError):
+        bs_greeks_batch(100.0, 100.0, 0.05, 0.2, 1.0, 2)
+
+def test_implied_vol_vec_rejects_non_positive_inputs():
+    from options_lab.black_scholes import implied_vol_vec
+    for S, K, T in ((-100.0, 100.0, 1.0), (100.0, -100.0, 1.0), (100.0, 100.0, 0.0)):
+        with pytest.raises(ValueError):
+            implied_vol_vec(np.array([5.0]), S, K, 0.05, T, 1)